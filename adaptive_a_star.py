@@ -1,5 +1,8 @@
 import heapq
+import numpy as np
+
 from utils.heuristics import manhattan_distance
+from utils.sensing import sense
 
 def adaptive_a_star_search(grid, start, goal, h_values):
     """
@@ -40,20 +43,26 @@ def adaptive_a_star_search(grid, start, goal, h_values):
                     heapq.heappush(open_list, (f_cost[neighbor], neighbor))
     return None, float('inf'), closed_set, parent
 
-def adaptive_a_star(grid, start, goal):
+def adaptive_a_star(grid, start, goal, sensor_radius=1, line_of_sight=False):
     """
     Repeated Adaptive A*:
     Updates the heuristic values based on previous searches.
+    The agent senses cells up to sensor_radius away and only replans
+    when a newly discovered obstacle blocks its current path.
+    Sensing happens only from the cell the agent stands on, so unlike earlier
+    versions it no longer sees the neighbors of the next cell (or past a wall)
+    before stepping; paths can differ from those versions even at radius 1.
     Returns the full path taken and a boolean indicating success.
     """
     n = len(grid)
-    known_grid = [[0 for _ in range(n)] for _ in range(n)]
+    true_grid = np.asarray(grid, dtype=int)
+    known_grid = np.zeros((n, n), dtype=int)
     current = start
     full_path = [current]
     
-    # Initialize known grid with start and goal positions
-    known_grid[start[0]][start[1]] = grid[start[0]][start[1]]
-    known_grid[goal[0]][goal[1]] = grid[goal[0]][goal[1]]
+    # Initialize known grid around start and with the goal position
+    sense(start, true_grid, known_grid, sensor_radius, line_of_sight)
+    known_grid[goal] = true_grid[goal]
     
     # Initialize heuristic values using Manhattan distance
     h_values = {}
@@ -62,14 +71,8 @@ def adaptive_a_star(grid, start, goal):
             h_values[(i, j)] = manhattan_distance((i, j), goal)
     
     while current != goal:
-        # Update knowledge about surrounding cells
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            adj = (current[0] + dx, current[1] + dy)
-            if 0 <= adj[0] < n and 0 <= adj[1] < n:
-                known_grid[adj[0]][adj[1]] = grid[adj[0]][adj[1]]
-        
         # Find path using current knowledge
-        result = adaptive_a_star_search(known_grid, current, goal, h_values)
+        result = adaptive_a_star_search(known_grid.tolist(), current, goal, h_values)
         if result[0] is None:
             return full_path, False
             
@@ -80,15 +83,11 @@ def adaptive_a_star(grid, start, goal):
             h_values[s] = cost - g_val
         
         # Move along path until obstacle or goal
+        path_cells = set(path)
         for next_cell in path[1:]:
-            # Update knowledge about next cell's surroundings
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                adj = (next_cell[0] + dx, next_cell[1] + dy)
-                if 0 <= adj[0] < n and 0 <= adj[1] < n:
-                    known_grid[adj[0]][adj[1]] = grid[adj[0]][adj[1]]
-            
             # Check if next cell is blocked
             if grid[next_cell[0]][next_cell[1]] == 1:
+                known_grid[next_cell] = 1
                 break
                 
             current = next_cell
@@ -96,5 +95,9 @@ def adaptive_a_star(grid, start, goal):
             
             if current == goal:
                 return full_path, True
+            
+            # Update knowledge about surroundings, replan only if the path got blocked
+            if sense(current, true_grid, known_grid, sensor_radius, line_of_sight) & path_cells:
+                break
                 
     return full_path, True
\ No newline at end of file
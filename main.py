@@ -132,11 +132,11 @@ def run_multi_worlds(args):
         for algo in algorithms:
             t0 = time.time()
             if algo == "forward":
-                path, success = repeated_forward_a_star(grid, start, goal)
+                path, success = repeated_forward_a_star(grid, start, goal, args.sensor_radius, args.line_of_sight)
             elif algo == "backward":
-                path, success = repeated_backward_a_star(grid, start, goal)
+                path, success = repeated_backward_a_star(grid, start, goal, args.sensor_radius, args.line_of_sight)
             elif algo == "adaptive":
-                path, success = adaptive_a_star(grid, start, goal)
+                path, success = adaptive_a_star(grid, start, goal, args.sensor_radius, args.line_of_sight)
             t1 = time.time()
             runtime = t1 - t0
 
@@ -172,11 +172,11 @@ def run_single_world(args):
     for algo in algorithms:
         t0 = time.time()
         if algo == "forward":
-            path, success = repeated_forward_a_star(grid, start, goal)
+            path, success = repeated_forward_a_star(grid, start, goal, args.sensor_radius, args.line_of_sight)
         elif algo == "backward":
-            path, success = repeated_backward_a_star(grid, start, goal)
+            path, success = repeated_backward_a_star(grid, start, goal, args.sensor_radius, args.line_of_sight)
         elif algo == "adaptive":
-            path, success = adaptive_a_star(grid, start, goal)
+            path, success = adaptive_a_star(grid, start, goal, args.sensor_radius, args.line_of_sight)
         t1 = time.time()
         runtime = t1 - t0
 
@@ -196,10 +196,22 @@ def run_single_world(args):
                               plot_title=plot_title,
                               algo_name=algo)
 
+def _positive_int(value):
+    """argparse type for integer options that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"must be an integer, got {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(description="Fast Trajectory Replanning Simulation")
     parser.add_argument('--grid_size', type=int, default=101, help="Size of the gridworld (n x n).")
     parser.add_argument('--n_worlds', type=int, default=50, help="Number of gridworlds to generate and test.")
+    parser.add_argument('--sensor_radius', type=_positive_int, default=1, help="How many cells away (Manhattan distance) the agent can sense obstacles.")
+    parser.add_argument('--line_of_sight', action='store_true', help="Only sense cells that are not hidden behind an obstacle.")
     args = parser.parse_args()
 
     # 1) Clear out directories: logs, results, and gridworlds
@@ -1,27 +1,32 @@
+import numpy as np
+
 from a_star import a_star_search
 from utils.heuristics import manhattan_distance
+from utils.sensing import sense
 
-def repeated_backward_a_star(grid, start, goal):
+def repeated_backward_a_star(grid, start, goal, sensor_radius=1, line_of_sight=False):
     """
     Enhanced Repeated Backward A* with:
     - Better obstacle detection
     - Improved path validation
     - Memory of previously seen obstacles
     - Smarter backtracking
+    - Sensing up to sensor_radius cells away (optionally line of sight only)
     """
     n = len(grid)
-    known_grid = [[0 for _ in range(n)] for _ in range(n)]
+    true_grid = np.asarray(grid, dtype=int)
+    known_grid = np.zeros((n, n), dtype=int)
     current = start
     full_path = [current]
     seen_obstacles = set()  # Remember discovered obstacles
     
     # Initialize knowledge of start and goal positions
-    update_known_grid(current, grid, known_grid, seen_obstacles, n)
-    update_known_grid(goal, grid, known_grid, seen_obstacles, n)
+    seen_obstacles |= sense(current, true_grid, known_grid, sensor_radius, line_of_sight)
+    seen_obstacles |= sense(goal, true_grid, known_grid)  # Goal neighbors only, independent of sensor range
     
     while current != goal:
         # Search from goal to current position
-        path, cost = a_star_search(known_grid, goal, current)
+        path, cost = a_star_search(known_grid.tolist(), goal, current)
         
         if path is None:
             # If we're stuck and have a previous position, try backtracking
@@ -29,7 +34,7 @@ def repeated_backward_a_star(grid, start, goal):
                 # print(f"Backtracking from {current}")
                 full_path.pop()  # Remove last position to prevent infinite loop
                 current = full_path[-1]  # Move to previous position
-                update_known_grid(current, grid, known_grid, seen_obstacles, n)
+                seen_obstacles |= sense(current, true_grid, known_grid, sensor_radius, line_of_sight)
                 continue
             
             print(f"Target not reachable from position {current}")
@@ -41,10 +46,8 @@ def repeated_backward_a_star(grid, start, goal):
         
         # Try to follow the path, updating knowledge as we go
         moved = False
+        path_cells = set(path)
         for next_pos in path[1:]:  # Skip current position
-            # Update knowledge about surroundings
-            update_known_grid(current, grid, known_grid, seen_obstacles, n)
-            
             # Validate the next move
             if is_valid_move(current, next_pos, grid, n):
                 current = next_pos
@@ -54,9 +57,15 @@ def repeated_backward_a_star(grid, start, goal):
                 # Check if we've reached the goal
                 if current == goal:
                     return full_path, True
+                
+                # Update knowledge about surroundings, replan only if the path got blocked
+                new_obstacles = sense(current, true_grid, known_grid, sensor_radius, line_of_sight)
+                seen_obstacles |= new_obstacles
+                if new_obstacles & path_cells:
+                    break
             else:
                 # Found new obstacle, update knowledge and break
-                known_grid[next_pos[0]][next_pos[1]] = 1
+                known_grid[next_pos] = 1
                 seen_obstacles.add(next_pos)
                 break
         
@@ -73,21 +82,6 @@ def repeated_backward_a_star(grid, start, goal):
     
     return full_path, True
 
-def update_known_grid(pos, grid, known_grid, seen_obstacles, n):
-    """
-    Updates known_grid with all cells visible from current position.
-    """
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-    
-    known_grid[pos[0]][pos[1]] = grid[pos[0]][pos[1]]  # Mark the current cell
-    
-    for dx, dy in directions:
-        new_x, new_y = pos[0] + dx, pos[1] + dy
-        if 0 <= new_x < n and 0 <= new_y < n:
-            if grid[new_x][new_y] == 1:
-                seen_obstacles.add((new_x, new_y))
-            known_grid[new_x][new_y] = grid[new_x][new_y]
-
 def is_valid_move(current, next_pos, grid, n):
     """
     Validates if a move from current to next_pos is legal.
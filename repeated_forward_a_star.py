@@ -1,25 +1,30 @@
+import numpy as np
+
 from a_star import a_star_search
 from utils.heuristics import manhattan_distance
+from utils.sensing import sense
 
-def repeated_forward_a_star(grid, start, goal):
+def repeated_forward_a_star(grid, start, goal, sensor_radius=1, line_of_sight=False):
     """
     Enhanced Repeated Forward A*:
     - Better obstacle detection
     - Improved path validation
     - Memory of seen obstacles
+    - Sensing up to sensor_radius cells away (optionally line of sight only)
     """
     n = len(grid)
-    known_grid = [[0 for _ in range(n)] for _ in range(n)]
+    true_grid = np.asarray(grid, dtype=int)
+    known_grid = np.zeros((n, n), dtype=int)
     current = start
     full_path = [current]
     seen_obstacles = set()
     
     # Initialize knowledge around start and goal
-    update_known_grid(current, grid, known_grid, seen_obstacles, n)
-    update_known_grid(goal, grid, known_grid, seen_obstacles, n)
+    seen_obstacles |= sense(current, true_grid, known_grid, sensor_radius, line_of_sight)
+    seen_obstacles |= sense(goal, true_grid, known_grid)  # Goal neighbors only, independent of sensor range
     
     while current != goal:
-        path, cost = a_star_search(known_grid, current, goal, heuristic=manhattan_distance)
+        path, cost = a_star_search(known_grid.tolist(), current, goal, heuristic=manhattan_distance)
         
         if path is None:
             # If we're stuck and have a previous position, try backtracking
@@ -27,7 +32,7 @@ def repeated_forward_a_star(grid, start, goal):
                 # print(f"Backtracking from {current}")
                 full_path.pop()  # Remove last position to prevent infinite loop
                 current = full_path[-1]  # Move to previous position
-                update_known_grid(current, grid, known_grid, seen_obstacles, n)
+                seen_obstacles |= sense(current, true_grid, known_grid, sensor_radius, line_of_sight)
                 continue
                 
             print(f"Target not reachable from position {current}")
@@ -36,10 +41,8 @@ def repeated_forward_a_star(grid, start, goal):
             
         # Follow the computed path step by step
         moved = False
+        path_cells = set(path)
         for next_pos in path[1:]:  # Skip current position
-            # Update knowledge about surroundings
-            update_known_grid(current, grid, known_grid, seen_obstacles, n)
-            
             # Validate the next move
             if is_valid_move(current, next_pos, grid, n):
                 current = next_pos
@@ -48,9 +51,15 @@ def repeated_forward_a_star(grid, start, goal):
                 
                 if current == goal:
                     return full_path, True
+                
+                # Update knowledge about surroundings, replan only if the path got blocked
+                new_obstacles = sense(current, true_grid, known_grid, sensor_radius, line_of_sight)
+                seen_obstacles |= new_obstacles
+                if new_obstacles & path_cells:
+                    break
             else:
                 # Found new obstacle, update knowledge and break
-                known_grid[next_pos[0]][next_pos[1]] = 1
+                known_grid[next_pos] = 1
                 seen_obstacles.add(next_pos)
                 break
         
@@ -67,21 +76,6 @@ def repeated_forward_a_star(grid, start, goal):
     
     return full_path, True
 
-def update_known_grid(pos, grid, known_grid, seen_obstacles, n):
-    """
-    Updates known_grid with all cells visible from current position.
-    """
-    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-    
-    known_grid[pos[0]][pos[1]] = grid[pos[0]][pos[1]]  # Mark the current cell
-    
-    for dx, dy in directions:
-        new_x, new_y = pos[0] + dx, pos[1] + dy
-        if 0 <= new_x < n and 0 <= new_y < n:
-            if grid[new_x][new_y] == 1:
-                seen_obstacles.add((new_x, new_y))
-            known_grid[new_x][new_y] = grid[new_x][new_y]
-
 def is_valid_move(current, next_pos, grid, n):
     """
     Validates if a move from current to next_pos is legal.
@@ -0,0 +1,129 @@
+import contextlib
+import io
+
+import numpy as np
+
+import adaptive_a_star
+import repeated_backward_a_star
+import repeated_forward_a_star
+from utils.sensing import sense
+
+# Fixed 15x15 maze ('#' = blocked) used for the agent-level checks
+MAZE = [
+    "...............",
+    ".#######.#####.",
+    ".#.....#.#...#.",
+    ".#.###.#.#.#.#.",
+    ".#.#...#...#.#.",
+    ".#.#.#######.#.",
+    "...#.......#...",
+    "####.#####.###.",
+    "...#.#...#.....",
+    ".#.#.#.#.#####.",
+    ".#...#.#.....#.",
+    ".#####.#####.#.",
+    ".....#.....#.#.",
+    ".###.#####.#.##",
+    "...#.......#...",
+]
+
+# (module, name of the search function it replans with, agent function)
+AGENTS = [
+    (repeated_forward_a_star, "a_star_search", repeated_forward_a_star.repeated_forward_a_star),
+    (repeated_backward_a_star, "a_star_search", repeated_backward_a_star.repeated_backward_a_star),
+    (adaptive_a_star, "adaptive_a_star_search", adaptive_a_star.adaptive_a_star),
+]
+
+
+def maze_grid():
+    """Returns MAZE as a list-of-lists grid (0 = unblocked, 1 = blocked)."""
+    return [[1 if cell == "#" else 0 for cell in row] for row in MAZE]
+
+
+def run_counting_searches(module, search_name, agent, grid, radius):
+    """Runs agent on grid and returns (path, success, number of searches)."""
+    search = getattr(module, search_name)
+    calls = []
+
+    def counting_search(*args, **kwargs):
+        calls.append(1)
+        return search(*args, **kwargs)
+
+    setattr(module, search_name, counting_search)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            path, success = agent(grid, (0, 0), (len(grid) - 1, len(grid) - 1), radius)
+    finally:
+        setattr(module, search_name, search)
+    return path, success, len(calls)
+
+
+def test_sense_finds_obstacles_within_radius():
+    rng = np.random.default_rng(0)
+    grid = (rng.random((12, 12)) < 0.3).astype(int)
+
+    for radius in (1, 2, 5):
+        for pos in [(0, 0), (0, 6), (11, 11), (6, 0), (6, 6), (11, 3)]:
+            known = np.zeros_like(grid)
+            found = sense(pos, grid, known, radius)
+            expected = {(r, c) for r in range(12) for c in range(12)
+                        if grid[r, c] == 1 and abs(r - pos[0]) + abs(c - pos[1]) <= radius}
+            assert found == expected, (radius, pos)
+            assert sense(pos, grid, known, radius) == set()
+
+
+def test_sense_reports_only_new_obstacles():
+    rng = np.random.default_rng(0)
+    grid = (rng.random((12, 12)) < 0.3).astype(int)
+
+    known = np.zeros_like(grid)
+    first = sense((3, 3), grid, known, 3)
+    second = sense((3, 5), grid, known, 3)
+    assert second == sense((3, 5), grid, np.zeros_like(grid), 3) - first
+
+
+def test_line_of_sight_hides_cells_behind_walls():
+    grid = np.zeros((9, 9), dtype=int)
+    grid[4, 5] = 1
+    known = -np.ones_like(grid)
+    assert sense((4, 4), grid, known, 4, line_of_sight=True) == {(4, 5)}
+    assert known[4, 6] == -1 and known[4, 7] == -1 and known[4, 8] == -1
+    assert known[4, 0] == 0 and known[3, 6] == 0 and known[5, 6] == 0
+
+
+def test_line_of_sight_blocks_wall_corners():
+    grid = np.zeros((5, 5), dtype=int)
+    grid[1, 2] = grid[2, 1] = 1
+    known = -np.ones_like(grid)
+    assert sense((2, 2), grid, known, 2, line_of_sight=True) == {(1, 2), (2, 1)}
+    assert known[1, 1] == -1 and known[3, 3] == 0 and known[1, 3] == 0
+
+    # Next to the border
+    known = -np.ones_like(grid)
+    sense((0, 0), grid, known, 3, line_of_sight=True)
+    assert known[0, 3] == 0 and known[1, 1] == 0
+
+
+def test_larger_radius_replans_no_more_often():
+    grid = maze_grid()
+
+    for module, search_name, agent in AGENTS:
+        replans = {}
+        for radius in (1, 2, 4, 8):
+            path, success, replans[radius] = run_counting_searches(
+                module, search_name, agent, grid, radius)
+            assert success, (agent.__name__, radius)
+
+            # Every step moves one cell through unblocked cells only
+            assert all(grid[x][y] == 0 for x, y in path), (agent.__name__, radius)
+            assert all(abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1
+                       for a, b in zip(path, path[1:])), (agent.__name__, radius)
+
+            assert replans[radius] <= replans[1], (agent.__name__, replans)
+
+
+if __name__ == '__main__':
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+    print("All sensing tests passed.")